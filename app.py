@@ -1,93 +1,62 @@
 import streamlit as st
 from spellchecker import SpellChecker
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.tokenize.treebank import TreebankWordDetokenizer
+from symspellpy import SymSpell
+from candidates import find_candidates
+from checker import worker_state, iter_results, remember_corrections, weighted_pos_profile
+import spacy
+from spacy.tokens import Doc
 import io
+import os
+import time
 import zipfile
 import csv
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 
-# --- NLTK 설정 (최신 버전 호환성 완벽 대비) ---
+# --- spaCy 설정 (품사 태거만 사용) ---
 @st.cache_resource
-def setup_nltk():
-    # 1. 문장 분리기 (기본)
-    try:
-        nltk.data.find('tokenizers/punkt')
-    except LookupError:
-        nltk.download('punkt')
-    
-    # 2. 문장 분리기 (최신 버전용 추가 데이터)
-    try:
-        nltk.data.find('tokenizers/punkt_tab')
-    except LookupError:
-        nltk.download('punkt_tab')
+def load_nlp():
+    return spacy.load("en_core_web_sm", disable=["parser", "ner", "lemmatizer"])
 
-    # 3. 품사 태거 (기본)
-    try:
-        nltk.data.find('taggers/averaged_perceptron_tagger')
-    except LookupError:
-        nltk.download('averaged_perceptron_tagger')
+nlp = load_nlp()
 
-    # 4. 품사 태거 (최신 버전용 영어 데이터 - 이게 없어서 에러 발생!)
-    try:
-        nltk.data.find('taggers/averaged_perceptron_tagger_eng')
-    except LookupError:
-        nltk.download('averaged_perceptron_tagger_eng')
-
-setup_nltk()
+@st.cache_resource
+def get_spell():
+    # Streamlit 재실행 간에도 사전을 한 번만 로드 (포크된 워커도 그대로 상속)
+    # pyspellchecker의 단어 빈도 사전으로 SymSpell 삭제 사전을 구성
+    # 맞춤법 검사용 단어 집합(frozenset)도 함께 만들어 캐시
+    dictionary = SpellChecker().word_frequency.dictionary
+    sym = SymSpell(max_dictionary_edit_distance=2, prefix_length=7)
+    for word, count in dictionary.items():
+        sym.create_dictionary_entry(word, count)
+    return sym, frozenset(dictionary.keys())
 
 # --- 핵심 로직 ---
-def tokenize_text(text):
-    return word_tokenize(text)
-
-def is_candidate_word(tok):
-    return isinstance(tok, str) and tok.isalpha() and len(tok) > 2 and not tok.isupper()
+def pos_tag(words):
+    # 이미 토큰화된 단어 목록을 한 번에 태깅 (nltk.pos_tag와 같은 (단어, 태그) 쌍 반환)
+    doc = nlp(Doc(nlp.vocab, words=words))
+    return [(tok.text, tok.tag_) for tok in doc]
 
 def count_real_words(text):
-    return sum(1 for t in tokenize_text(text) if is_candidate_word(t))
+    # 하위 호환용: analyze_and_correct가 total_words를 함께 반환하므로 화면 처리에서는 쓰지 않음
+    return sum(map(len, find_candidates(text).values()))
 
-def analyze_and_correct(text, spell):
-    tokens = tokenize_text(text)
-    candidate_indices = [i for i, t in enumerate(tokens) if is_candidate_word(t)]
-    candidate_words = [tokens[i].lower() for i in candidate_indices]
-    misspelled_set = spell.unknown(candidate_words)
-
-    corrections = {}
-    error_count = 0
-    misspelled_list = []
-    
-    detok = TreebankWordDetokenizer()
-    corrected_tokens = list(tokens)
-
-    for idx, lw in zip(candidate_indices, candidate_words):
-        if lw in misspelled_set:
-            surface = tokens[idx]
-            suggestion = spell.correction(lw)
-            
-            if not suggestion: 
-                suggestion = surface
-                
-            corrections.setdefault(surface, suggestion)
-            error_count += 1
-            misspelled_list.append(surface)
-            
-            if surface.istitle():
-                final_word = suggestion.capitalize()
-            elif surface.isupper():
-                final_word = suggestion.upper()
-            else:
-                final_word = suggestion
-
-            corrected_tokens[idx] = final_word
+@st.cache_resource
+def get_correction_cache():
+    # 오타 → 교정값 캐시 (Streamlit 재실행 간에도 유지)
+    # 워커가 새로 구한 교정값은 결과와 함께 돌려받아 부모가 병합하고, 다음 포크에서 그대로 상속됨
+    return {}
 
-    corrected_text = detok.detokenize([t if isinstance(t, str) else "" for t in corrected_tokens])
-    
-    # 품사 분석
-    pos_tags = nltk.pos_tag(misspelled_list)
-    pos_profile = Counter(tag for word, tag in pos_tags)
+# --- ZIP 출력 ---
+ZIP_COMPRESSLEVEL = 1
 
-    return corrected_text, corrections, error_count, pos_profile
+def zip_entry(name):
+    # 이미 인코딩된 바이트를 쓰기 위한 엔트리 정보 (압축 방식을 명시)
+    info = zipfile.ZipInfo(name, date_time=time.localtime(time.time())[:6])
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o600 << 16
+    return info
 
 # --- Streamlit 화면 구성 ---
 st.title("Spelling Checker & Profiler")
@@ -97,56 +66,70 @@ uploaded_files = st.file_uploader("Choose txt files", type="txt", accept_multipl
 
 if uploaded_files:
     if st.button("Start Analysis"):
-        spell = SpellChecker()
-        
         # 결과물을 모을 ZIP 파일 생성 준비
         zip_buffer = io.BytesIO()
         
-        error_summary = []
-        all_pos_profile = Counter()
+        # 완료 순서가 아닌 업로드 순서로 리포트를 채움
+        error_summary = [None] * len(uploaded_files)
+        all_misspelled = Counter()
         
-        with zipfile.ZipFile(zip_buffer, "w") as zf:
+        with zipfile.ZipFile(zip_buffer, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL) as zf:
             progress_bar = st.progress(0)
             
-            for i, uploaded_file in enumerate(uploaded_files):
-                # 1. 파일 읽기
-                original_text = uploaded_file.getvalue().decode("utf-8", errors="replace")
-                filename = uploaded_file.name
-                
-                # 2. 분석 및 교정
-                corrected_text, corrections, err_count, pos_profile = analyze_and_correct(original_text, spell)
-                all_pos_profile.update(pos_profile)
-                
-                # 3. 교정된 파일 ZIP에 추가
-                zf.writestr(f"corrected_{filename}", corrected_text)
-                
-                # 4. 요약 정보 저장
-                total_words = count_real_words(original_text)
-                error_rate = (err_count / total_words * 100) if total_words > 0 else 0
-                error_summary.append([filename, total_words, err_count, f"{error_rate:.2f}%"])
-                
-                # 진행률 업데이트
-                progress_bar.progress((i + 1) / len(uploaded_files))
+            # 포크 전에 사전을 로드해 두면 워커가 피클링 없이 그대로 공유
+            worker_state["sym"], worker_state["known"] = get_spell()
+            worker_state["corrections"] = get_correction_cache()
+            
+            processes = min(os.cpu_count() or 1, len(uploaded_files))
+            # ZIP 압축은 전용 스레드 하나가 순서대로 처리 (zlib은 압축 중 GIL을 놓으므로 결과 수신과 겹침)
+            zip_jobs = []
+            with ThreadPoolExecutor(max_workers=1) as zip_writer:
+                # 1. 파일 읽기 + 2. 분석 및 교정 (워커 프로세스에서 수행)
+                # getvalue()는 업로드 버퍼를 복사 없이 그대로 돌려주고, 디코딩은 워커에서 한 번만 수행
+                # 제너레이터로 넘기면 풀의 작업 공급 스레드가 읽기를 맡아 분석과 겹쳐서 진행됨
+                payloads = ((i, f.name, f.getvalue()) for i, f in enumerate(uploaded_files))
+                # Streamlit이 중단·재실행 예외를 던져도 풀이 바로 정리되도록 제너레이터를 명시적으로 닫음
+                with closing(iter_results(payloads, processes)) as results:
+                    for i, result in enumerate(results):
+                        filename = result["filename"]
+                        all_misspelled.update(result["misspelled_counts"])
+                        remember_corrections(worker_state["corrections"], result["learned_corrections"])
+                    
+                        # 3. 교정된 파일 ZIP에 추가
+                        zip_jobs.append(zip_writer.submit(zf.writestr, zip_entry(f"corrected_{filename}"), result["corrected_data"], compresslevel=ZIP_COMPRESSLEVEL))
+                    
+                        # 4. 요약 정보 저장
+                        error_summary[result["index"]] = [filename, result["total_words"], result["err_count"], f"{result['error_rate']:.2f}%"]
+                    
+                        # 진행률 업데이트
+                        progress_bar.progress((i + 1) / len(uploaded_files))
+
+            # 압축 스레드에서 발생한 예외 전파
+            for job in zip_jobs:
+                job.result()
+
+            # 전체 오타 품사 분석 (태거 호출을 파일별이 아닌 한 번으로 묶음)
+            all_pos_profile = weighted_pos_profile(all_misspelled, pos_tag)
 
             # 5. CSV 리포트 생성 및 ZIP에 추가
             csv_buffer = io.StringIO()
             writer = csv.writer(csv_buffer)
             writer.writerow(['Filename', 'Total Words', 'Error Count', 'Error Rate'])
             writer.writerows(error_summary)
-            zf.writestr("summary_report.csv", csv_buffer.getvalue())
+            zf.writestr(zip_entry("summary_report.csv"), csv_buffer.getvalue().encode("utf-8"), compresslevel=ZIP_COMPRESSLEVEL)
             
             # 6. 텍스트 리포트(품사 분석 포함) 생성 및 ZIP에 추가
             txt_report = "Total POS Error Profile:\n"
             for tag, count in all_pos_profile.most_common():
                 txt_report += f"{tag}: {count}\n"
-            zf.writestr("pos_analysis_report.txt", txt_report)
+            zf.writestr(zip_entry("pos_analysis_report.txt"), txt_report.encode("utf-8"), compresslevel=ZIP_COMPRESSLEVEL)
 
         st.success("Analysis Complete!")
         
         # 다운로드 버튼
         st.download_button(
             label="Download Result (ZIP)",
-            data=zip_buffer.getvalue(),
+            data=zip_buffer,
             file_name="spelling_check_results.zip",
             mime="application/zip"
         )
@@ -0,0 +1,32 @@
+import re
+
+# 3글자 이상 영문 단어만 후보로 추출
+# - 이메일·URL·파일명·하이픈 복합어·숫자/밑줄이 붙은 토큰 안쪽의 단어는 제외
+# - 하이픈 두 개 이상(--)은 대시로 보고 단어 구분자로 취급
+# - doesn't 같은 축약형은 기존 토크나이저처럼 "does"만 후보로 취급 ("doesn" 조각은 제외)
+_CAND_RE = re.compile(
+    r"(?<![\w.@/])(?<!(?<!-)-)"
+    r"(?:[A-Za-z]{3,}(?=n['’]t\b)"
+    r"|[A-Za-z]{3,}(?![\w@/]|-(?!-)|[.:][\w/]|['’]t\b))"
+)
+
+# URL(://, 쿼리 문자열의 ?·=)이나 Windows 경로(\)가 들어 있는 공백 구분 덩어리 전체
+_UNSAFE_CHUNK_RE = re.compile(r"(?<!\S)\S*?(?://|\\|=|\?(?=\w))\S*")
+
+def find_candidates(text):
+    # 단어(표면형) → 시작 오프셋 목록, 전부 대문자인 약어와 URL·경로 안의 단어는 제외
+    unsafe = [m.span() for m in _UNSAFE_CHUNK_RE.finditer(text)]
+    unsafe.append((len(text) + 1, len(text) + 1))
+    j = 0
+
+    positions = {}
+    for m in _CAND_RE.finditer(text):
+        start = m.start()
+        while unsafe[j][1] <= start:
+            j += 1
+        if unsafe[j][0] <= start:
+            continue
+        surface = m.group()
+        if not surface.isupper():
+            positions.setdefault(surface, []).append(start)
+    return positions
@@ -0,0 +1,125 @@
+import multiprocessing
+from collections import Counter
+from itertools import repeat
+from symspellpy import Verbosity
+from candidates import find_candidates
+
+# Streamlit 스크립트(app.py)는 실행될 때마다 __main__이 교체되므로,
+# 워커 프로세스가 참조하는 함수와 상태는 import 가능한 이 모듈에 둠
+
+CORRECTION_CACHE_SIZE = 100_000
+
+# --- 핵심 로직 ---
+# 포크 직전에 채워 두는 워커용 상태 (워커가 Streamlit 캐시의 잠금을 거치지 않도록 일반 전역 변수 사용)
+worker_state = {}
+
+def remember_corrections(cache, new_corrections):
+    # 캐시가 가득 차면 가장 먼저 들어온 항목부터 제거 (dict의 삽입 순서를 이용한 FIFO)
+    for lw, suggestion in new_corrections.items():
+        if lw not in cache and len(cache) >= CORRECTION_CACHE_SIZE:
+            cache.pop(next(iter(cache)), None)
+        cache[lw] = suggestion
+
+def lookup_correction(lw):
+    # 같은 오타에 대해 편집 거리 탐색을 반복하지 않도록 결과를 메모이즈
+    cache = worker_state["corrections"]
+    if lw in cache:
+        return cache[lw]
+    suggestions = worker_state["sym"].lookup(lw, Verbosity.TOP, max_edit_distance=2)
+    suggestion = suggestions[0].term if suggestions else None
+    worker_state["learned"][lw] = suggestion
+    remember_corrections(cache, {lw: suggestion})
+    return suggestion
+
+def match_case(surface, suggestion):
+    # 원래 단어의 대소문자 형태를 교정 단어에 반영
+    if surface.istitle():
+        return suggestion.capitalize()
+    if surface.isupper():
+        return suggestion.upper()
+    return suggestion
+
+def analyze_and_correct(text, known):
+    positions = find_candidates(text)
+    # 고유 표면형만 map(str.lower)로 한 번에 소문자화하고, 사전에 없는 단어는 집합 차로 구함
+    candidate_words = dict(zip(positions, map(str.lower, positions)))
+    total_words = sum(map(len, positions.values()))
+    misspelled_set = set(candidate_words.values()).difference(known)
+    # 고유 오타별로 한 번만 교정값을 구하고, 루프에서는 딕셔너리 조회만 수행
+    correction_map = {w: lookup_correction(w) for w in misspelled_set}
+
+    corrections = {}
+    error_count = 0
+    misspelled_counts = Counter()
+    spans = []
+
+    # 고유 표면형 단위로 처리하고, 오타가 아닌 단어의 출현 위치는 건드리지 않음
+    for surface, starts in positions.items():
+        lw = candidate_words[surface]
+        if lw in misspelled_set:
+            suggestion = correction_map[lw]
+            
+            if not suggestion: 
+                suggestion = surface
+                
+            corrections[surface] = suggestion
+            error_count += len(starts)
+            misspelled_counts[surface] = len(starts)
+
+            # 출현 위치별 (시작, 길이, 교정 단어) 튜플을 C 수준의 zip/repeat로 생성
+            spans.extend(zip(starts, repeat(len(surface)), repeat(match_case(surface, suggestion))))
+
+    # 원문에 교정 단어만 이어 붙여 공백·문장부호를 그대로 보존
+    spans.sort()
+    corrected_parts = []
+    cursor = 0
+
+    for start, length, final_word in spans:
+        corrected_parts.append(text[cursor:start])
+        corrected_parts.append(final_word)
+        cursor = start + length
+
+    corrected_parts.append(text[cursor:])
+    corrected_text = "".join(corrected_parts)
+
+    # 품사 분석은 모든 파일의 오타를 모아 한 번에 수행 (화면 처리 참고)
+    return corrected_text, corrections, error_count, total_words, misspelled_counts
+
+def weighted_pos_profile(misspelled_counts, pos_tag):
+    # 고유 오타만 태깅하고 출현 횟수로 가중 (태거는 앞뒤 단어를 보므로 출현마다 태깅한 결과와 같지는 않음)
+    profile = Counter()
+    for word, tag in pos_tag(list(misspelled_counts)):
+        profile[tag] += misspelled_counts[word]
+    return profile
+
+# --- 병렬 처리 (파일 단위로 프로세스 풀에 분배) ---
+def process_file(payload: tuple[int, str, bytes]) -> dict:
+    index, filename, data = payload
+    worker_state["learned"] = {}
+    original_text = data.decode("utf-8", errors="replace")
+    known = worker_state["known"]
+    corrected_text, corrections, err_count, total_words, misspelled_counts = analyze_and_correct(original_text, known)
+    error_rate = (err_count / total_words * 100) if total_words > 0 else 0
+    return {
+        # 업로드 순서 (같은 이름의 파일이 여러 개여도 리포트 순서를 유지)
+        "index": index,
+        "filename": filename,
+        # 부모 프로세스에서 다시 디코딩/인코딩하지 않도록 바이트로 반환
+        "corrected_data": corrected_text.encode("utf-8"),
+        "corrections": corrections,
+        "err_count": err_count,
+        "total_words": total_words,
+        "error_rate": error_rate,
+        "misspelled_counts": misspelled_counts,
+        # 이 파일에서 새로 구한 교정값 (부모 프로세스의 캐시에 병합)
+        "learned_corrections": worker_state["learned"],
+    }
+
+def iter_results(payloads, processes):
+    # 워커는 포크 시점의 worker_state(사전·교정 캐시)를 그대로 상속받아야 하므로
+    # fork가 없는 환경(Windows 등)에서는 순차 처리
+    if "fork" not in multiprocessing.get_all_start_methods():
+        yield from map(process_file, payloads)
+        return
+    with multiprocessing.get_context("fork").Pool(processes) as pool:
+        yield from pool.imap_unordered(process_file, payloads)
@@ -0,0 +1,36 @@
+from candidates import find_candidates
+
+
+def test_skips_emails_urls_and_filenames():
+    text = "Contact john.smith@gmail.com or visit www.example.com today. See https://example.org/docs and report.docx."
+    assert list(find_candidates(text)) == ["Contact", "visit", "today", "See", "and"]
+
+
+def test_skips_hyphenated_and_alphanumeric_tokens():
+    text = "Step pre-processing for the abc123 hello_world data."
+    assert list(find_candidates(text)) == ["Step", "for", "the", "data"]
+
+
+def test_contractions_keep_stem_only():
+    positions = find_candidates("He doesn't know, John's dog can't run. She shouldn’t.")
+    assert list(positions) == ["does", "know", "John", "dog", "run", "She", "should"]
+    assert "doesn" not in positions
+
+
+def test_offsets_and_acronyms():
+    positions = find_candidates("The cat saw the cat near NASA.")
+    assert positions == {"The": [0], "cat": [4, 16], "saw": [8], "the": [12], "near": [20]}
+
+
+def test_skips_url_query_strings_and_windows_paths():
+    text = "Open https://example.com/search?query=recieve&lang=englsh#sectoin or C:\\Users\\jdoe\\Documnets\\notes.txt now."
+    assert list(find_candidates(text)) == ["Open", "now"]
+
+
+def test_trailing_question_mark_is_not_a_query_string():
+    assert list(find_candidates("Are you sure? Yes.")) == ["Are", "you", "sure", "Yes"]
+
+
+def test_double_hyphen_dash_separates_words():
+    assert list(find_candidates("He paused--then left.")) == ["paused", "then", "left"]
+    assert list(find_candidates("A well-known pre- and post-war era.")) == ["and", "era"]
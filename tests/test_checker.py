@@ -0,0 +1,79 @@
+import checker
+
+
+def test_remember_corrections_evicts_oldest_when_full(monkeypatch):
+    monkeypatch.setattr(checker, "CORRECTION_CACHE_SIZE", 2)
+    cache = {}
+    checker.remember_corrections(cache, {"teh": "the", "speling": "spelling"})
+    checker.remember_corrections(cache, {"recieve": "receive"})
+    assert cache == {"speling": "spelling", "recieve": "receive"}
+
+    # 이미 있는 항목을 갱신할 때는 제거하지 않음
+    checker.remember_corrections(cache, {"speling": "spelling"})
+    assert cache == {"speling": "spelling", "recieve": "receive"}
+
+
+import pytest
+from symspellpy import SymSpell
+
+WORDS = {"the": 1000, "cat": 50, "sat": 40, "on": 900, "mat": 30, "spelling": 20, "receive": 25, "dog": 60, "see": 80}
+
+
+@pytest.fixture
+def known(monkeypatch):
+    sym = SymSpell(max_dictionary_edit_distance=2, prefix_length=7)
+    for word, count in WORDS.items():
+        sym.create_dictionary_entry(word, count)
+    known = frozenset(WORDS)
+    monkeypatch.setattr(checker, "worker_state", {"sym": sym, "known": known, "corrections": {}, "learned": {}})
+    return known
+
+
+def test_match_case():
+    assert checker.match_case("Teh", "the") == "The"
+    assert checker.match_case("teh", "the") == "the"
+    assert checker.match_case("TEH", "the") == "THE"
+
+
+def test_repeated_misspellings_and_counts(known):
+    text = "Teh cat sat on teh mat. teh dog."
+    corrected, corrections, err_count, total_words, misspelled_counts = checker.analyze_and_correct(text, known)
+    assert corrected == "The cat sat on the mat. the dog."
+    assert corrections == {"Teh": "the", "teh": "the"}
+    assert err_count == 3
+    assert total_words == 7
+    assert misspelled_counts == {"Teh": 1, "teh": 2}
+
+
+def test_word_without_suggestion_is_left_unchanged(known):
+    corrected, corrections, err_count, total_words, _ = checker.analyze_and_correct("The qwxzyk cat.", known)
+    assert corrected == "The qwxzyk cat."
+    assert corrections == {"qwxzyk": "qwxzyk"}
+    assert (err_count, total_words) == (1, 3)
+
+
+def test_uncorrected_text_is_preserved_byte_for_byte(known):
+    text = "  Teh\tcat sat…\r\n\r\non  the   matt!!  see https://x.org/?q=teh, NASA, pre-teh, \"Speling\"\n"
+    corrected, _, _, _, _ = checker.analyze_and_correct(text, known)
+    assert corrected == text.replace("Teh", "The").replace("matt", "mat").replace('"Speling"', '"Spelling"')
+
+
+def test_process_file_returns_upload_index_and_bytes(known):
+    result = checker.process_file((2, "a.txt", "Teh cat".encode("utf-8")))
+    assert result["index"] == 2
+    assert result["filename"] == "a.txt"
+    assert result["corrected_data"] == b"The cat"
+    assert result["error_rate"] == 50.0
+    assert result["learned_corrections"] == {"teh": "the"}
+
+
+def test_weighted_pos_profile_tags_unique_words_once():
+    calls = []
+
+    def fake_tagger(words):
+        calls.append(words)
+        return [(w, "NN" if w.islower() else "NNP") for w in words]
+
+    profile = checker.weighted_pos_profile({"teh": 3, "Teh": 1, "speling": 2}, fake_tagger)
+    assert calls == [["teh", "Teh", "speling"]]
+    assert profile == {"NN": 5, "NNP": 1}